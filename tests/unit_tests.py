@@ -33,10 +33,15 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 """
 
+import os
+import tempfile
 import unittest
 import logging
 
-from gametable import GameTable
+import numpy as np
+
+from gametable import GameTable, GameTableError, main, parse_choices
+from tests import payoffs
 from tests.test_data import GameTableTestData
 
 
@@ -189,6 +194,276 @@ class GameTableTests(unittest.TestCase):
         self.assertEqual(game_table.player1_dominated, player1_dominated)
         self.assertEqual(game_table.player2_dominated, player2_dominated)
         
+    def zero_sum_game_table(self, payoffs):
+        """
+        Construct a zero-sum `GameTable` from a nested list of player 1's
+        payoffs, indexed by player 1's choice and then player 2's choice.
+
+        """
+
+        game_table = GameTable(calc_player1_payoff=lambda player1_choice, player2_choice:
+                                   payoffs[player1_choice][player2_choice],
+                               calc_player2_payoff=lambda player2_choice, player1_choice:
+                                   -payoffs[player1_choice][player2_choice],
+                               choices=range(len(payoffs)))
+
+        game_table.construct()
+        return game_table
+
+    def test_solve_zero_sum_mixed(self):
+        """ Test `gametable.GameTable.solve_zero_sum` on rock, paper, scissors,
+            which has no pure strategy equilibrium.
+
+        """
+
+        game_table = self.zero_sum_game_table([[0, -1, 1],
+                                               [1, 0, -1],
+                                               [-1, 1, 0]])
+
+        self.assertEqual(game_table.nash_equilibria, set())
+        solution = game_table.solve_zero_sum()
+        self.assertAlmostEqual(solution.value, 0)
+        for choice in game_table.choices:
+            self.assertAlmostEqual(solution.player1_strategy[choice], 1 / 3)
+            self.assertAlmostEqual(solution.player2_strategy[choice], 1 / 3)
+
+    def test_solve_zero_sum_saddle_point(self):
+        """ Test `gametable.GameTable.solve_zero_sum` on a game with a saddle
+            point.
+
+        """
+
+        game_table = self.zero_sum_game_table([[3, 1, 4],
+                                               [5, 2, 6],
+                                               [0, -1, 7]])
+
+        solution = game_table.solve_zero_sum()
+        self.assertAlmostEqual(solution.value, 2)
+        self.assertAlmostEqual(solution.player1_strategy[1], 1)
+        self.assertAlmostEqual(solution.player2_strategy[1], 1)
+
+    def test_solve_zero_sum_warm_start(self):
+        """ Test warm starting `gametable.GameTable.solve_zero_sum` from the
+            solution of a perturbed game table.
+
+        """
+
+        payoffs = [[(3 * row + 7 * column) % 11 - 5 for column in range(10)] for row in range(10)]
+        solution = self.zero_sum_game_table(payoffs).solve_zero_sum()
+        payoffs[2][3] += 0.01
+        game_table = self.zero_sum_game_table(payoffs)
+        cold_solution = game_table.solve_zero_sum()
+        self.assertFalse(cold_solution.warm_started)
+
+        warm_solution = game_table.solve_zero_sum(warm_start=solution)
+        self.assertTrue(warm_solution.warm_started)
+        self.assertAlmostEqual(warm_solution.value, cold_solution.value)
+
+        # Neither player can improve on the game value against the other
+        # player's optimal strategy.
+        for choice in game_table.choices:
+            player1_payoff = sum(probability * payoffs[choice][column]
+                                 for column, probability in warm_solution.player2_strategy.items())
+
+            player2_payoff = sum(probability * payoffs[row][choice]
+                                 for row, probability in warm_solution.player1_strategy.items())
+
+            self.assertLessEqual(player1_payoff, warm_solution.value + 1e-9)
+            self.assertGreaterEqual(player2_payoff, warm_solution.value - 1e-9)
+
+    def test_solve_zero_sum_warm_start_over_max_iterations(self):
+        """ Test that a warm start to `gametable.GameTable.solve_zero_sum`
+            that needs more than `max_iterations` pivots falls back to a
+            cold solve.
+
+        """
+
+        random = np.random.default_rng(2)
+        payoffs = random.normal(size=(40, 40))
+        solution = self.zero_sum_game_table(payoffs.tolist()).solve_zero_sum()
+        game_table = self.zero_sum_game_table((payoffs + random.normal(scale=0.5, size=(40, 40))).tolist())
+        self.assertTrue(game_table.solve_zero_sum(warm_start=solution).warm_started)
+
+        cold_solution = game_table.solve_zero_sum(max_iterations=5)
+        warm_solution = game_table.solve_zero_sum(warm_start=solution, max_iterations=5)
+        self.assertFalse(warm_solution.warm_started)
+        self.assertAlmostEqual(warm_solution.value, cold_solution.value)
+
+    def test_solve_zero_sum_rejected_warm_start(self):
+        """ Test `gametable.GameTable.solve_zero_sum` with a warm start from
+            a game table of a different size.
+
+        """
+
+        solution = self.zero_sum_game_table([[1, -1], [-1, 1]]).solve_zero_sum()
+        game_table = self.zero_sum_game_table([[0, -1, 1],
+                                               [1, 0, -1],
+                                               [-1, 1, 0]])
+
+        warm_solution = game_table.solve_zero_sum(warm_start=solution)
+        self.assertFalse(warm_solution.warm_started)
+        self.assertAlmostEqual(warm_solution.value, 0)
+
+    def test_solve_zero_sum_not_zero_sum(self):
+        """ Test `gametable.GameTable.solve_zero_sum` on a game that isn't
+            zero-sum.
+
+        """
+
+        with self.assertRaises(GameTableError):
+            self.game_table.solve_zero_sum()
+
+    def test_epsilon_dominants(self):
+        """ Test `gametable.GameTable.player1_epsilon_dominants` and
+            `gametable.GameTable.player2_epsilon_dominants` on noisy payoffs.
+
+        """
+
+        def calc_player1_payoff(my_price, their_price):
+            # Choices 2 and 5 are best, up to noise of at most 0.1.
+            return (2 if my_price in (2, 5) else 1) + ((my_price * 7 + their_price * 3) % 10) / 100
+
+        def calc_player2_payoff(my_price, their_price):
+            return (1 if my_price in (0, 4) else 2) - ((my_price * 3 + their_price * 7) % 10) / 100
+
+        game_table = GameTable(calc_player1_payoff=calc_player1_payoff,
+                               calc_player2_payoff=calc_player2_payoff,
+                               choices=range(0, 8))
+
+        game_table.construct()
+        self.assertEqual(game_table.player1_dominants, [])
+        self.assertEqual(game_table.player1_epsilon_dominants(0.1), [2, 5])
+        self.assertEqual(game_table.player2_epsilon_dominants(0.1), [1, 2, 3, 5, 6, 7])
+        self.assertEqual(game_table.player1_epsilon_dominants(0.1, dominated=True), [0, 1, 3, 4, 6, 7])
+        self.assertEqual(game_table.player2_epsilon_dominants(0.1, dominated=True), [0, 4])
+        self.assertEqual(game_table.player1_epsilon_dominants(0), game_table.player1_dominants)
+        self.assertEqual(game_table.player2_epsilon_dominants(0), game_table.player2_dominants)
+        with self.assertRaises(GameTableError):
+            game_table.player1_epsilon_dominants(-1)
+
+    def test_epsilon_dominants_exact(self):
+        """ Test that `gametable.GameTable.player1_epsilon_dominants` and
+            `gametable.GameTable.player2_epsilon_dominants` agree with the
+            exact dominant strategies when epsilon is 0.
+
+        """
+
+        # The prisoner's dilemma, where defecting dominates cooperating.
+        prison_payoffs = {('C', 'C'): 3, ('C', 'D'): 0, ('D', 'C'): 5, ('D', 'D'): 1}
+
+        def calc_payoff(my_choice, their_choice):
+            return prison_payoffs[my_choice, their_choice]
+
+        game_table = GameTable(calc_player1_payoff=calc_payoff,
+                               calc_player2_payoff=calc_payoff,
+                               choices=['C', 'D'])
+
+        game_table.construct()
+        self.assertEqual(game_table.player1_dominants, ['D'])
+        self.assertEqual(game_table.player2_dominants, ['D'])
+        self.assertEqual(game_table.player1_epsilon_dominants(0), ['D'])
+        self.assertEqual(game_table.player2_epsilon_dominants(0), ['D'])
+        self.assertEqual(game_table.player1_epsilon_dominants(0, dominated=True), game_table.player1_dominated)
+        self.assertEqual(game_table.player2_epsilon_dominants(0, dominated=True), game_table.player2_dominated)
+        self.assertEqual(game_table.player1_dominated, ['C'])
+        self.assertEqual(game_table.epsilon_nash_equilibria(0), {('D', 'D')})
+
+    def test_epsilon_nash_equilibria(self):
+        """ Test `gametable.GameTable.epsilon_nash_equilibria` and
+            `gametable.GameTable.nash_epsilons`.
+
+        """
+
+        self.assertEqual(self.game_table.epsilon_nash_equilibria(0), self.game_table.nash_equilibria)
+        with self.assertRaises(GameTableError):
+            self.game_table.epsilon_nash_equilibria(-1)
+
+        equilibria = self.game_table.epsilon_nash_equilibria(100)
+        self.assertTrue(self.game_table.nash_equilibria < equilibria)
+
+        epsilons = self.game_table.nash_epsilons()
+        self.assertEqual(len(epsilons), len(self.test_data.PRICES) ** 2)
+        self.assertEqual({cell for cell, epsilon in epsilons.items() if epsilon <= 100}, equilibria)
+        for equilibrium in self.game_table.nash_equilibria:
+            self.assertEqual(epsilons[equilibrium], 0)
+
+        # Player 1 gains 10 by lowering their price from 42 to 41.
+        self.assertEqual(epsilons[42, 42], 10)
+
+    def test_parse_choices(self):
+        """ Test `gametable.parse_choices` """
+
+        self.assertEqual(parse_choices('31:59'), list(self.test_data.PRICES))
+        self.assertEqual(parse_choices('0:10:5'), [0, 5])
+        self.assertEqual(parse_choices('1,2.5,4'), [1, 2.5, 4])
+        with self.assertRaises(GameTableError):
+            parse_choices('1:x')
+
+    def test_main(self):
+        """ Test building a game table with `gametable.main` """
+
+        with tempfile.TemporaryDirectory() as directory:
+            for jobs in ('1', '2'):
+                output = os.path.join(directory, 'table.csv')
+                status = main(['tests.payoffs:pricing_payoff', '31:59', output,
+                               '--jobs', jobs, '--block-size', '5'])
+
+                self.assertEqual(status, 0)
+                with open(output) as output_file:
+                    self.assertEqual(output_file.read(), str(self.game_table))
+
+    def test_main_resume(self):
+        """ Test resuming a `gametable.main` build from its checkpoints. """
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'table.csv')
+            checkpoint_dir = os.path.join(directory, 'checkpoints')
+            argv = ['tests.payoffs:pricing_payoff', '31:59', output,
+                    '--block-size', '10', '--checkpoint-dir', checkpoint_dir]
+
+            self.assertEqual(main(argv), 0)
+
+            # Simulate a build that was killed before its last block finished.
+            os.remove(os.path.join(checkpoint_dir, 'rows-000020-000027.pickle'))
+            payoffs.pricing_payoff_calls = 0
+            self.assertEqual(main(argv), 0)
+            self.assertEqual(payoffs.pricing_payoff_calls, 8 * 28 * 2)
+            with open(output) as output_file:
+                self.assertEqual(output_file.read(), str(self.game_table))
+
+            # Checkpoints are reused when resuming with a different block size.
+            os.remove(os.path.join(checkpoint_dir, 'rows-000010-000019.pickle'))
+            payoffs.pricing_payoff_calls = 0
+            self.assertEqual(main(argv[:3] + ['--block-size', '3', '--checkpoint-dir', checkpoint_dir]), 0)
+            self.assertEqual(payoffs.pricing_payoff_calls, 10 * 28 * 2)
+            payoffs.pricing_payoff_calls = 0
+            self.assertEqual(main(argv[:3] + ['--checkpoint-dir', checkpoint_dir]), 0)
+            self.assertEqual(payoffs.pricing_payoff_calls, 0)
+            with open(output) as output_file:
+                self.assertEqual(output_file.read(), str(self.game_table))
+
+            # Checkpoints from a different game table are rejected.
+            self.assertEqual(main(['tests.payoffs:pricing_payoff', '30:59', output,
+                                   '--block-size', '10', '--checkpoint-dir', checkpoint_dir]), 1)
+
+    def test_main_invalid_arguments(self):
+        """ Test that `gametable.main` rejects invalid arguments before
+            building a game table.
+
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'table.csv')
+            payoffs.pricing_payoff_calls = 0
+            for argv in (['tests.payoffs:pricing_payoff', '31:59', output, '--block-size', '0'],
+                         ['tests.payoffs:pricing_payoff', '31:59', output, '--jobs', '0'],
+                         ['tests.payoffs:pricing_payoff', '5:5', output],
+                         ['tests.payoffs:pricing_payoff', '31:59', os.path.join(directory, 'missing', 'table.csv')]):
+                self.assertEqual(main(argv), 1)
+
+            self.assertEqual(payoffs.pricing_payoff_calls, 0)
+            self.assertFalse(os.path.exists(output))
+
     def test_iter(self):
         """ Test iterating over a `GameTable` instance. """
         